@@ -42,6 +42,8 @@ class ValidationLossEvaluator(SentenceEvaluator):
         self.loss_model = loss_model
         self.device = torch.device("cuda") if torch.cuda.is_available() else torch.device("cpu")
         loss_model.to(self.device)
+        # Tokenized validation batches, collated on the first call and reused for every later epoch
+        self._batches = None
 
     def __call__(self, model, output_path: str = None, epoch: int = -1, steps: int = -1) -> float:
         """
@@ -55,13 +57,15 @@ class ValidationLossEvaluator(SentenceEvaluator):
         # Initialize cumulative loss for this epoch
         cumulative_loss_value = 0
 
-        # Apply batching
-        self.dataloader.collate_fn = model.smart_batching_collate
-        for step, batch in enumerate(self.dataloader):
+        # Apply batching, the validation pairs are fixed so they only need to be tokenized once
+        if self._batches is None:
+            self.dataloader.collate_fn = model.smart_batching_collate
+            self._batches = list(self.dataloader)
+
+        for step, batch in enumerate(self._batches):
             features, labels = batch
-            # Set data to the correct device
-            for idx in range(len(features)):
-                features[idx] = batch_to_device(features[idx], self.device)
+            # Set data to the correct device, without overwriting the cached (CPU) batch
+            features = [batch_to_device(dict(feature), self.device) for feature in features]
             labels = labels.to(self.device)
             with torch.no_grad():  # do not perform backprop (i.e., do not train)
                 # Compute loss and cumulate it
@@ -69,6 +73,6 @@ class ValidationLossEvaluator(SentenceEvaluator):
                 cumulative_loss_value += loss
 
         # Compute average epoch loss
-        epoch_loss = cumulative_loss_value / len(self.dataloader)
+        epoch_loss = cumulative_loss_value / len(self._batches)
 
         return epoch_loss
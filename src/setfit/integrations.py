@@ -1,10 +1,18 @@
+import copy
+import gc
 import importlib.util
-from typing import TYPE_CHECKING
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import torch
 
 from .utils import BestRun
 
 
 if TYPE_CHECKING:
+    import optuna
+
     from .trainer import SetFitTrainer
 
 
@@ -17,23 +25,131 @@ def default_hp_search_backend():
         return "optuna"
 
 
-def run_hp_search_optuna(trainer: "SetFitTrainer", n_trials: int, direction: str, **kwargs) -> BestRun:
+def _is_distributed() -> bool:
+    if not torch.distributed.is_available() or not torch.distributed.is_initialized():
+        return False
+    return torch.distributed.get_world_size() > 1
+
+
+# Seconds between two lookups of the study while waiting for the trials of the other processes
+SYNC_POLL_INTERVAL = 5.0
+
+
+def _broadcast_from_main_process(obj: Any) -> Any:
+    object_list = [obj]
+    torch.distributed.broadcast_object_list(object_list, src=0)
+    return object_list[0]
+
+
+def _wait_for_processes(
+    study: "optuna.Study", search_id: str, rank: int, world_size: int, sync_timeout: Optional[float] = None
+) -> None:
+    # The processes sync through the study storage rather than a collective, as a collective would time out
+    # after the process group timeout while the other processes are still running their trials
+    study.set_user_attr(f"{search_id}_rank_{rank}_finished", True)
+    deadline = None if sync_timeout is None else time.monotonic() + sync_timeout
+    while True:
+        user_attrs = study.user_attrs
+        if all(user_attrs.get(f"{search_id}_rank_{other_rank}_finished") for other_rank in range(world_size)):
+            return
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(
+                f"The other processes did not finish their trials within `sync_timeout` ({sync_timeout} seconds)."
+            )
+        time.sleep(SYNC_POLL_INTERVAL)
+
+
+def run_hp_search_optuna(
+    trainer: "SetFitTrainer",
+    n_trials: int,
+    direction: str,
+    n_jobs: int = 1,
+    timeout: Optional[float] = None,
+    storage: Optional[Union[str, "optuna.storages.BaseStorage"]] = None,
+    study_name: Optional[str] = None,
+    load_if_exists: bool = False,
+    gc_after_trial: bool = True,
+    disable_gc: bool = False,
+    pruner: Optional["optuna.pruners.BasePruner"] = None,
+    sync_timeout: Optional[float] = None,
+    **kwargs,
+) -> BestRun:
     import optuna
 
+    distributed = _is_distributed()
+    if distributed and n_jobs != 1:
+        raise ValueError("Running trials concurrently with `n_jobs` is not supported in distributed runs.")
+    if distributed and storage is None:
+        raise ValueError(
+            "Distributed hyperparameter searches require a `storage` that is shared by all processes, e.g. an RDB URL."
+        )
+    is_main_process = not distributed or torch.distributed.get_rank() == 0
+
     # Heavily inspired by transformers.integrations.run_hp_search_optuna
     # https://github.com/huggingface/transformers/blob/cbb8a37929c3860210f95c9ec99b8b84b8cf57a1/src/transformers/integrations.py#L160
     def _objective(trial):
-        trainer.objective = None
-        trainer.train(trial=trial)
-        # If there hasn't been any evaluation during the training loop.
-        if getattr(trainer, "objective", None) is None:
-            metrics = trainer.evaluate()
-            trainer.objective = trainer.compute_objective(metrics)
-        return trainer.objective
-
-    timeout = kwargs.pop("timeout", None)
-    n_jobs = kwargs.pop("n_jobs", 1)
-    study = optuna.create_study(direction=direction, **kwargs)
-    study.optimize(_objective, n_trials=n_trials, timeout=timeout, n_jobs=n_jobs)
-    best_trial = study.best_trial
-    return BestRun(str(best_trial.number), best_trial.value, best_trial.params, study)
+        trial_trainer = trainer
+        if n_jobs != 1:
+            # Concurrent trials run in threads, so every trial needs its own model, objective and loss history,
+            # as well as its own metrics, which keep the predictions of a `compute` call on the instance
+            trial_trainer = copy.copy(trainer)
+            trial_trainer.sentence_transformer_history = trainer._create_history()
+            trial_trainer.classifier_history = trainer._create_history()
+            trial_trainer._metric_cache = {}
+
+        trial_trainer.objective = None
+        try:
+            trial_trainer.train(trial=trial)
+            # If there hasn't been any evaluation during the training loop.
+            if getattr(trial_trainer, "objective", None) is None:
+                metrics = trial_trainer.evaluate()
+                trial_trainer.objective = trial_trainer.compute_objective(metrics)
+            return trial_trainer.objective
+        finally:
+            # Hand the cached blocks of the finished trial's model back to the CUDA allocator
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+
+    # optuna falls back to a `MedianPruner` if no pruner is given, while trials should only be pruned on request
+    study_pruner = pruner if pruner is not None else optuna.pruners.NopPruner()
+    if is_main_process:
+        study = optuna.create_study(
+            direction=direction,
+            storage=storage,
+            study_name=study_name,
+            load_if_exists=load_if_exists,
+            pruner=study_pruner,
+            **kwargs,
+        )
+    if distributed:
+        # The other processes join the study once the main process has created it. This is the only collective,
+        # which all processes reach at about the same time, unlike the end of their trials
+        study_name, search_id = _broadcast_from_main_process(
+            (study.study_name, f"setfit_{uuid.uuid4().hex}") if is_main_process else None
+        )
+        if not is_main_process:
+            study = optuna.load_study(
+                study_name=study_name, storage=storage, sampler=kwargs.get("sampler"), pruner=study_pruner
+            )
+        world_size, rank = torch.distributed.get_world_size(), torch.distributed.get_rank()
+        if n_trials is not None:
+            n_trials = n_trials // world_size + int(rank < n_trials % world_size)
+
+    # Every `study.direction` lookup is a storage round-trip, which is an SQL query for RDB storages
+    trainer.hp_search_direction = study.direction
+    trainer.hp_search_pruning = pruner is not None
+    # `gc.collect()` still runs after each trial if `gc_after_trial`, even if automatic garbage collection is disabled
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.disable()
+    try:
+        study.optimize(_objective, n_trials=n_trials, timeout=timeout, n_jobs=n_jobs, gc_after_trial=gc_after_trial)
+        if distributed:
+            # The best trial is only picked once the trials of all processes have finished
+            _wait_for_processes(study, search_id, rank, world_size, sync_timeout=sync_timeout)
+        best_trial = study.best_trial
+        best_run = BestRun(str(best_trial.number), best_trial.value, best_trial.params, study)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best_run
@@ -323,8 +323,8 @@ class SetFitModel(PyTorchModelHubMixin):
         self,
         x_train: List[str],
         y_train: Union[List[int], List[List[int]]],
-        x_test: List[str],
-        y_test: Union[List[int], List[List[int]]],
+        x_test: Optional[List[str]],
+        y_test: Optional[Union[List[int], List[List[int]]]],
         num_epochs: int,
         batch_size: Optional[int] = None,
         learning_rate: Optional[float] = None,
@@ -339,7 +339,9 @@ class SetFitModel(PyTorchModelHubMixin):
             device = self.model_body.device
 
             train_dataloader = self._prepare_dataloader(x_train, y_train, batch_size, max_length)
-            test_dataloader = self._prepare_dataloader(x_test, y_test, batch_size, max_length)
+            test_dataloader = (
+                self._prepare_dataloader(x_test, y_test, batch_size, max_length) if x_test is not None else None
+            )
             criterion = self.model_head.get_loss_fn()
             optimizer = self._prepare_optimizer(learning_rate, body_learning_rate, l2_weight)
             scheduler = torch.optim.lr_scheduler.StepLR(optimizer, step_size=5, gamma=0.5)
@@ -356,6 +358,9 @@ class SetFitModel(PyTorchModelHubMixin):
                                              log_callback=train_callback)
                 scheduler.step()
 
+                if test_dataloader is None:
+                    continue
+
                 # Validation
                 # Set model to evaluation mode
                 self.model_body.eval()
@@ -476,9 +481,12 @@ class SetFitModel(PyTorchModelHubMixin):
             outputs = torch.from_numpy(outputs)
         return outputs
 
-    def predict(self, x_test: List[str], as_numpy: bool = False) -> Union[torch.Tensor, "ndarray"]:
+    def predict(
+        self, x_test: List[str], as_numpy: bool = False, batch_size: int = 32
+    ) -> Union[torch.Tensor, "ndarray"]:
         embeddings = self.model_body.encode(
             x_test,
+            batch_size=batch_size,
             normalize_embeddings=self.normalize_embeddings,
             convert_to_tensor=self.has_differentiable_head,
         )
@@ -486,9 +494,12 @@ class SetFitModel(PyTorchModelHubMixin):
         outputs = self.model_head.predict(embeddings)
         return self._output_type_conversion(outputs, as_numpy=as_numpy)
 
-    def predict_proba(self, x_test: List[str], as_numpy: bool = False) -> Union[torch.Tensor, "ndarray"]:
+    def predict_proba(
+        self, x_test: List[str], as_numpy: bool = False, batch_size: int = 32
+    ) -> Union[torch.Tensor, "ndarray"]:
         embeddings = self.model_body.encode(
             x_test,
+            batch_size=batch_size,
             normalize_embeddings=self.normalize_embeddings,
             convert_to_tensor=self.has_differentiable_head,
         )
@@ -740,54 +751,91 @@ class SupConLoss(nn.Module):
         return loss
 
 
-def sentence_pairs_generation(sentences, labels, pairs):
-    # Initialize two empty lists to hold the (sentence, sentence) pairs and
-    # labels to indicate if a pair is positive or negative
+def _sentence_pair_indices(labels: "ndarray", num_iterations: int = 1) -> "ndarray":
+    """Samples a positive and a negative partner for every sentence, `num_iterations` times.
 
-    num_classes = np.unique(labels)
-    label_to_idx = {x: i for i, x in enumerate(num_classes)}
-    positive_idxs = [np.where(labels == i)[0] for i in num_classes]
-    negative_idxs = [np.where(labels != i)[0] for i in num_classes]
+    The partners are drawn for all anchors sharing a label at once, rather than one anchor at a time.
 
-    for first_idx in range(len(sentences)):
-        current_sentence = sentences[first_idx]
-        label = labels[first_idx]
-        second_idx = np.random.choice(positive_idxs[label_to_idx[label]])
-        positive_sentence = sentences[second_idx]
-        # Prepare a positive pair and update the sentences and labels
-        # lists, respectively
-        pairs.append(InputExample(texts=[current_sentence, positive_sentence], label=1.0))
-
-        third_idx = np.random.choice(negative_idxs[label_to_idx[label]])
-        negative_sentence = sentences[third_idx]
-        # Prepare a negative pair of sentences and update our lists
-        pairs.append(InputExample(texts=[current_sentence, negative_sentence], label=0.0))
-    # Return a 2-tuple of our sentence pairs and labels
+    Returns:
+        `ndarray`: An integer array of shape `(2 * num_iterations * len(labels), 3)` with the index of the first
+        sentence, the index of the second sentence and whether the pair is positive (`1`) or negative (`0`).
+        Every anchor is followed by its positive pair and then its negative pair.
+    """
+    num_classes, label_ids = np.unique(labels, return_inverse=True)
+    anchors = np.tile(np.arange(len(labels)), num_iterations)
+    anchor_label_ids = label_ids[anchors]
+
+    positives = np.empty_like(anchors)
+    negatives = np.empty_like(anchors)
+    for label_id in range(len(num_classes)):
+        mask = anchor_label_ids == label_id
+        num_anchors = np.count_nonzero(mask)
+        positives[mask] = np.random.choice(np.flatnonzero(label_ids == label_id), size=num_anchors)
+        negatives[mask] = np.random.choice(np.flatnonzero(label_ids != label_id), size=num_anchors)
+
+    pair_idxs = np.empty((2 * len(anchors), 3), dtype=np.int64)
+    pair_idxs[:, 0] = np.repeat(anchors, 2)
+    pair_idxs[0::2, 1] = positives
+    pair_idxs[1::2, 1] = negatives
+    pair_idxs[0::2, 2] = 1
+    pair_idxs[1::2, 2] = 0
+    return pair_idxs
+
+
+def sentence_pairs_generation(sentences, labels, pairs, num_iterations: int = 1):
+    # Append a positive and a negative (sentence, sentence) pair for every sentence,
+    # with labels to indicate if a pair is positive or negative
+    pair_idxs = _sentence_pair_indices(labels, num_iterations)
+    # The number of pairs is known upfront, so grow `pairs` once and fill it in place
+    offset = len(pairs)
+    pairs.extend([None] * len(pair_idxs))
+    for pair_idx, (first_idx, second_idx, is_positive) in enumerate(pair_idxs.tolist(), start=offset):
+        pairs[pair_idx] = InputExample(texts=[sentences[first_idx], sentences[second_idx]], label=float(is_positive))
     return pairs
 
 
-def sentence_pairs_generation_multilabel(sentences, labels, pairs):
+def sentence_pairs_generation_multilabel(sentences, labels, pairs, num_iterations: int = 1):
     # Initialize two empty lists to hold the (sentence, sentence) pairs and
     # labels to indicate if a pair is positive or negative
-    for first_idx in range(len(sentences)):
-        current_sentence = sentences[first_idx]
-        sample_labels = np.where(labels[first_idx, :] == 1)[0]
-        if len(np.where(labels.dot(labels[first_idx, :].T) == 0)[0]) == 0:
-            continue
-        else:
-            for _label in sample_labels:
-                second_idx = np.random.choice(np.where(labels[:, _label] == 1)[0])
-                positive_sentence = sentences[second_idx]
-                # Prepare a positive pair and update the sentences and labels
-                # lists, respectively
-                pairs.append(InputExample(texts=[current_sentence, positive_sentence], label=1.0))
-
-            # Search for sample that don't have a label in common with current
-            # sentence
-            negative_idx = np.where(labels.dot(labels[first_idx, :].T) == 0)[0]
-            negative_sentence = sentences[np.random.choice(negative_idx)]
-            # Prepare a negative pair of sentences and update our lists
-            pairs.append(InputExample(texts=[current_sentence, negative_sentence], label=0.0))
+
+    # The label lookups only depend on `labels`, so they are shared by all iterations
+    sample_labels = [np.where(labels[first_idx, :] == 1)[0] for first_idx in range(len(sentences))]
+    positive_idxs = [np.where(labels[:, _label] == 1)[0] for _label in range(labels.shape[1])]
+    # Whether a sample has a negative only depends on its labels, so it is computed once per distinct label row.
+    # The negatives themselves are only looked up when sampling, keeping the memory linear in the number of samples
+    has_label = labels == 1
+    label_rows, label_row_idxs = np.unique(has_label, axis=0, return_inverse=True)
+    has_negative = np.array([not (has_label @ label_row).all() for label_row in label_rows])[label_row_idxs.reshape(-1)]
+
+    # Sentences without any negative sample are skipped, the others yield a positive pair for each
+    # of their labels and one negative pair. Knowing the total upfront, `pairs` is grown only once.
+    pairs_per_iteration = sum(
+        len(sample_labels[first_idx]) + 1 for first_idx in range(len(sentences)) if has_negative[first_idx]
+    )
+    pair_idx = len(pairs)
+    pairs.extend([None] * (num_iterations * pairs_per_iteration))
+
+    for _ in range(num_iterations):
+        for first_idx in range(len(sentences)):
+            current_sentence = sentences[first_idx]
+            if not has_negative[first_idx]:
+                continue
+            else:
+                for _label in sample_labels[first_idx]:
+                    second_idx = np.random.choice(positive_idxs[_label])
+                    positive_sentence = sentences[second_idx]
+                    # Prepare a positive pair and update the sentences and labels
+                    # lists, respectively
+                    pairs[pair_idx] = InputExample(texts=[current_sentence, positive_sentence], label=1.0)
+                    pair_idx += 1
+
+                # Search for sample that don't have a label in common with current
+                # sentence
+                negative_idxs = np.flatnonzero(~(has_label @ has_label[first_idx]))
+                negative_sentence = sentences[np.random.choice(negative_idxs)]
+                # Prepare a negative pair of sentences and update our lists
+                pairs[pair_idx] = InputExample(texts=[current_sentence, negative_sentence], label=0.0)
+                pair_idx += 1
     # Return a 2-tuple of our sentence pairs and labels
     return pairs
 
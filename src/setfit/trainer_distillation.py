@@ -215,11 +215,12 @@ class DistillationSetFitTrainer(SetFitTrainer):
                 train_loss = self.loss_class(self.student_model.model_body)
 
             total_train_steps = len(train_dataloader) * num_epochs
-            logger.info("***** Running training *****")
-            logger.info(f"  Num examples = {len(train_examples)}")
-            logger.info(f"  Num epochs = {num_epochs}")
-            logger.info(f"  Total optimization steps = {total_train_steps}")
-            logger.info(f"  Total train batch size = {batch_size}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("***** Running training *****")
+                logger.info("  Num examples = %d", len(train_examples))
+                logger.info("  Num epochs = %d", num_epochs)
+                logger.info("  Total optimization steps = %d", total_train_steps)
+                logger.info("  Total train batch size = %d", batch_size)
 
             warmup_steps = math.ceil(total_train_steps * self.warmup_proportion)
             self.student_model.model_body.fit(
@@ -236,6 +237,8 @@ class DistillationSetFitTrainer(SetFitTrainer):
             self.student_model.fit(
                 x_train,
                 y_train,
+                x_test=None,
+                y_test=None,
                 num_epochs=num_epochs,
                 batch_size=batch_size,
                 learning_rate=learning_rate,
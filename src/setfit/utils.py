@@ -62,6 +62,12 @@ def default_hp_space_optuna(trial) -> Dict[str, Any]:
     }
 
 
+def history_to_dicts(split_history: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Converts one split of a column-wise loss history (e.g. `trainer.sentence_transformer_history["train"]`)
+    into a list with one dictionary per logged entry."""
+    return [dict(zip(split_history.keys(), values)) for values in zip(*split_history.values())]
+
+
 def load_data_splits(
     dataset: str, sample_sizes: List[int], add_data_augmentation: bool = False
 ) -> Tuple[DatasetDict, Dataset]:
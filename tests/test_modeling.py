@@ -10,7 +10,12 @@ from sklearn.multiclass import OneVsRestClassifier
 from sklearn.multioutput import ClassifierChain, MultiOutputClassifier
 
 from setfit import SetFitHead, SetFitModel
-from setfit.modeling import MODEL_HEAD_NAME, sentence_pairs_generation, sentence_pairs_generation_multilabel
+from setfit.modeling import (
+    MODEL_HEAD_NAME,
+    _sentence_pair_indices,
+    sentence_pairs_generation,
+    sentence_pairs_generation_multilabel,
+)
 
 
 torch_cuda_available = pytest.mark.skipif(not torch.cuda.is_available(), reason="PyTorch must be compiled with CUDA")
@@ -46,6 +51,37 @@ def test_sentence_pairs_generation_multilabel():
     assert pairs[0].label == 1.0
 
 
+def test_sentence_pairs_generation_num_iterations():
+    sentences = np.array(["sent 1", "sent 2", "sent 3"])
+    labels = np.array(["label 1", "label 2", "label 3"])
+
+    pairs = sentence_pairs_generation(sentences, labels, [], num_iterations=2)
+
+    assert len(pairs) == 12
+    assert [pair.label for pair in pairs] == [1.0, 0.0] * 6
+    assert [pair.texts[0] for pair in pairs[::2]] == ["sent 1", "sent 2", "sent 3"] * 2
+
+
+def test_sentence_pair_indices():
+    labels = np.array([0, 1, 0, 1, 2])
+
+    pair_idxs = _sentence_pair_indices(labels, num_iterations=3)
+
+    assert pair_idxs.shape == (30, 3)
+    assert (pair_idxs[0::2, 0] == np.tile(np.arange(5), 3)).all()
+    assert ((labels[pair_idxs[:, 0]] == labels[pair_idxs[:, 1]]) == pair_idxs[:, 2].astype(bool)).all()
+
+
+def test_sentence_pairs_generation_multilabel_num_iterations():
+    sentences = np.array(["sent 1", "sent 2", "sent 3"])
+    labels = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0]])
+
+    pairs = sentence_pairs_generation_multilabel(sentences, labels, [], num_iterations=2)
+
+    assert len(pairs) == 12
+    assert [pair.label for pair in pairs] == [1.0, 0.0] * 6
+
+
 def test_setfit_model_body():
     model = SetFitModel.from_pretrained("sentence-transformers/paraphrase-albert-small-v2")
 
@@ -234,6 +270,15 @@ def test_setfithead_multitarget_from_pretrained():
     assert not np.isclose(y_pred_probs.sum(), 1)  # Should not sum to one
 
 
+def test_predict_batch_size():
+    model = SetFitModel.from_pretrained("sentence-transformers/paraphrase-albert-small-v2")
+    model.model_head.fit(model.model_body.encode(["positive", "negative"]), [1, 0])
+
+    texts = ["a", "b", "c", "d", "e"]
+    assert (model.predict(texts, batch_size=2) == model.predict(texts)).all()
+    assert model.predict_proba(texts, batch_size=2).shape == (5, 2)
+
+
 def test_to_logistic_head():
     model = SetFitModel.from_pretrained("sentence-transformers/paraphrase-albert-small-v2")
     devices = (
@@ -1,26 +1,48 @@
+import datetime
+import json
 import pathlib
 import re
 import tempfile
-from unittest import TestCase
+import threading
+import time
+from unittest import TestCase, mock
 
 import evaluate
 import pytest
 import torch
 from datasets import Dataset, load_dataset
+from huggingface_hub import HfApi
+from huggingface_hub.utils import HfHubHTTPError
 from sentence_transformers import losses
+from sklearn.linear_model import LogisticRegression
+from torch.utils.data import DataLoader
 from transformers.testing_utils import require_optuna
 from transformers.utils.hp_naming import TrialShortNamer
 
 from setfit import logging
+from setfit.custom.validation_loss_evaluator import ValidationLossEvaluator
+from setfit.integrations import run_hp_search_optuna
 from setfit.modeling import SetFitModel, SupConLoss
-from setfit.trainer import SetFitTrainer
-from setfit.utils import BestRun
+from setfit.trainer import SetFitTrainer, _file_digests
+from setfit.utils import BestRun, history_to_dicts
 
 
 logging.set_verbosity_warning()
 logging.enable_propagation()
 
 
+def _get_tf32_flags():
+    return (
+        torch.backends.cuda.matmul.allow_tf32,
+        torch.backends.cudnn.allow_tf32,
+        torch.backends.cudnn.benchmark,
+    )
+
+
+def _set_tf32_flags(flags):
+    torch.backends.cuda.matmul.allow_tf32, torch.backends.cudnn.allow_tf32, torch.backends.cudnn.benchmark = flags
+
+
 class SetFitTrainerTest(TestCase):
     def setUp(self):
         self.model = SetFitModel.from_pretrained("sentence-transformers/paraphrase-albert-small-v2")
@@ -49,12 +71,15 @@ class SetFitTrainerTest(TestCase):
         self.assertIsInstance(log_history, dict)
         self.assertTrue(split in log_history.keys())
         split_log_history = log_history[split]
-        self.assertIsInstance(split_log_history, list)
-        self.assertEqual(len(split_log_history), num_epochs)
-        self.assertIsInstance(split_log_history[0], dict)
-        self.assertTrue("epoch" in split_log_history[0].keys())
-        self.assertTrue("loss_value" in split_log_history[0].keys())
-        self.assertIsInstance(split_log_history[0]["loss_value"], float)
+        self.assertIsInstance(split_log_history, dict)
+        self.assertTrue("epoch" in split_log_history.keys())
+        self.assertTrue("loss_value" in split_log_history.keys())
+        self.assertEqual(len(split_log_history["loss_value"]), num_epochs)
+        self.assertIsInstance(split_log_history["loss_value"][0], float)
+
+        log_entries = history_to_dicts(split_log_history)
+        self.assertEqual(len(log_entries), num_epochs)
+        self.assertEqual(log_entries[0].keys(), split_log_history.keys())
 
     def test_sentence_transformer_trainer_logging(self):
         def get_model():
@@ -78,6 +103,19 @@ class SetFitTrainerTest(TestCase):
         self.test_trainer_logging(trainer.sentence_transformer_history, num_epochs, "train")
         self.test_trainer_logging(trainer.sentence_transformer_history, num_epochs, "test")
 
+    def test_trainer_skips_validation_loss_without_logging(self):
+        dataset = Dataset.from_dict({"text": ["a", "b", "c"], "label": [0, 1, 2]})
+
+        trainer = SetFitTrainer(
+            model=self.model, train_dataset=dataset, eval_dataset=dataset, num_iterations=self.num_iterations
+        )
+        trainer.train()
+        self.assertEqual(trainer.sentence_transformer_history["test"]["loss_value"], [])
+
+        trainer = SetFitTrainer(model=self.model, train_dataset=dataset, num_iterations=self.num_iterations)
+        trainer.train(log_steps=1)
+        self.assertEqual(trainer.sentence_transformer_history["test"]["loss_value"], [])
+
     def test_classifier_trainer_logging(self):
         def get_model():
             model_name = "sentence-transformers/paraphrase-albert-small-v2"
@@ -129,6 +167,18 @@ class SetFitTrainerTest(TestCase):
         metrics = trainer.evaluate()
         self.assertEqual(metrics["accuracy"], 1.0)
 
+    def test_trainer_caches_loaded_metric(self):
+        dataset = Dataset.from_dict({"text": ["a", "b", "c"], "label": [0, 1, 2], "extra_column": ["d", "e", "f"]})
+        trainer = SetFitTrainer(
+            model=self.model, train_dataset=dataset, eval_dataset=dataset, num_iterations=self.num_iterations
+        )
+        trainer.train()
+        trainer.evaluate()
+        metric_fn = trainer._metric_cache[("accuracy", None)]
+        trainer.evaluate()
+        self.assertEqual(len(trainer._metric_cache), 1)
+        self.assertIs(trainer._metric_cache[("accuracy", None)], metric_fn)
+
     def test_trainer_works_with_alternate_dataset_for_evaluate(self):
         dataset = Dataset.from_dict({"text": ["a", "b", "c"], "label": [0, 1, 2], "extra_column": ["d", "e", "f"]})
         alternate_dataset = Dataset.from_dict(
@@ -180,6 +230,19 @@ class SetFitTrainerTest(TestCase):
         with pytest.raises(ValueError, match=expected_message):
             trainer._validate_column_mapping(trainer.train_dataset)
 
+    def test_column_mapping_validation_is_cached(self):
+        dataset = Dataset.from_dict({"text": ["a", "b", "c"], "label": [0, 1, 2]})
+        trainer = SetFitTrainer(
+            model=self.model, train_dataset=dataset, eval_dataset=dataset, num_iterations=self.num_iterations
+        )
+        trainer._validate_column_mapping(dataset)
+        self.assertEqual(trainer._validated_columns, {(False, ("text", "label"), None)})
+
+        # A different column mapping must be validated again
+        trainer.column_mapping = {"text_new": "text", "label_new": "label"}
+        with pytest.raises(ValueError):
+            trainer._validate_column_mapping(dataset)
+
     def test_trainer_raises_error_when_dataset_not_split(self):
         """Verify that an error is raised if we pass an unsplit dataset to the trainer."""
         dataset = Dataset.from_dict({"text": ["a", "b", "c", "d"], "label": [0, 0, 1, 1]}).train_test_split(
@@ -232,6 +295,21 @@ class SetFitTrainerTest(TestCase):
 
         assert formatted_dataset[1]["text"] == "b"
 
+    def test_column_mapping_keeps_dataset_format(self):
+        dataset = Dataset.from_dict({"text_new": ["a", "b", "c"], "label_new": [0, 1, 2]}).with_format("numpy")
+
+        trainer = SetFitTrainer(
+            model=self.model,
+            train_dataset=dataset,
+            eval_dataset=dataset,
+            num_iterations=self.num_iterations,
+            column_mapping={"text_new": "text", "label_new": "label"},
+        )
+        formatted_dataset = trainer._apply_column_mapping(trainer.train_dataset, trainer.column_mapping)
+
+        assert formatted_dataset.column_names == ["text", "label"]
+        assert formatted_dataset.format["type"] == "numpy"
+
     def test_trainer_support_callable_as_metric(self):
         dataset = Dataset.from_dict(
             {"text_new": ["a", "b", "c"], "label_new": [0, 1, 2], "extra_column": ["d", "e", "f"]}
@@ -294,6 +372,98 @@ class SetFitTrainerTest(TestCase):
         with pytest.raises(ValueError):
             SetFitTrainer(warmup_proportion=-0.1)
 
+    def test_trainer_raises_error_with_amp_and_bf16(self):
+        with pytest.raises(ValueError):
+            SetFitTrainer(model=self.model, use_amp=True, use_bf16=True)
+
+    def test_trainer_trains_body_with_bf16_autocast(self):
+        dataset = Dataset.from_dict({"text": ["a", "b", "c"], "label": [0, 1, 2]})
+        self.model.to("cpu")
+        trainer = SetFitTrainer(
+            model=self.model,
+            train_dataset=dataset,
+            eval_dataset=dataset,
+            num_iterations=self.num_iterations,
+            use_bf16=True,
+        )
+
+        with mock.patch("torch.autocast", wraps=torch.autocast) as autocast:
+            trainer.train()
+        autocast.assert_called_once_with(device_type="cpu", dtype=torch.bfloat16)
+        # Autocast only changes the dtype of the computations, not of the weights
+        assert all(param.dtype == torch.float32 for param in trainer.model.model_body.parameters())
+
+    def test_trainer_restores_tf32_flags(self):
+        dataset = Dataset.from_dict({"text": ["a", "b", "c"], "label": [0, 1, 2]})
+        trainer = SetFitTrainer(model=self.model, train_dataset=dataset, num_iterations=self.num_iterations)
+
+        flags_during_training = []
+        fit = self.model.model_body.fit
+
+        def fit_recording_flags(*args, **kwargs):
+            flags_during_training.append(_get_tf32_flags())
+            return fit(*args, **kwargs)
+
+        previous_flags = _get_tf32_flags()
+        _set_tf32_flags((False, False, False))
+        try:
+            with mock.patch.object(self.model.model_body, "fit", side_effect=fit_recording_flags):
+                trainer.train()
+            assert flags_during_training == [(True, True, True)]
+            assert _get_tf32_flags() == (False, False, False)
+        finally:
+            _set_tf32_flags(previous_flags)
+
+    @require_optuna
+    def test_trainer_restores_tf32_flags_with_concurrent_trials(self):
+        dataset = Dataset.from_dict({"text": ["a", "b", "c"], "label": [0, 1, 2]})
+        trainer = SetFitTrainer(
+            model_init=lambda: SetFitModel(model_body=self.model.model_body, model_head=LogisticRegression()),
+            train_dataset=dataset,
+            eval_dataset=dataset,
+            num_iterations=self.num_iterations,
+        )
+
+        flags_during_training = []
+        both_trials_running = threading.Barrier(2, timeout=30)
+
+        def fit_waiting_for_other_trial(*args, **kwargs):
+            both_trials_running.wait()
+            flags_during_training.append(_get_tf32_flags())
+            both_trials_running.wait()
+
+        previous_flags = _get_tf32_flags()
+        _set_tf32_flags((False, False, False))
+        try:
+            with mock.patch.object(self.model.model_body, "fit", side_effect=fit_waiting_for_other_trial):
+                trainer.hyperparameter_search(hp_space=lambda trial: {}, n_trials=2, n_jobs=2)
+            # The process-wide flags are shared by the concurrent trials, and only restored once the last one is done
+            assert flags_during_training == [(True, True, True)] * 2
+            assert _get_tf32_flags() == (False, False, False)
+        finally:
+            _set_tf32_flags(previous_flags)
+
+    def test_trainer_compiles_model_body(self):
+        trainer = SetFitTrainer(model=self.model, compile_model=True)
+        # `nn.Module.compile` only wraps the forward pass, the compilation itself happens on the first call
+        assert trainer.model.model_body._compiled_call_impl is not None
+
+    def test_dataloader_kwargs_only_use_workers_for_map_style_datasets(self):
+        trainer = SetFitTrainer(model=self.model, num_workers=2, prefetch_factor=4)
+
+        kwargs = trainer._dataloader_kwargs()
+        self.assertEqual(kwargs["num_workers"], 2)
+        self.assertEqual(kwargs["prefetch_factor"], 4)
+        self.assertTrue(kwargs["persistent_workers"])
+
+        validation_kwargs = trainer._dataloader_kwargs(persistent=False)
+        self.assertEqual(validation_kwargs["num_workers"], 2)
+        self.assertFalse(validation_kwargs["persistent_workers"])
+
+        iterable_kwargs = trainer._dataloader_kwargs(iterable_dataset=True)
+        self.assertNotIn("num_workers", iterable_kwargs)
+        self.assertEqual(iterable_kwargs["pin_memory"], torch.cuda.is_available())
+
 
 class SetFitTrainerDifferentiableHeadTest(TestCase):
     def setUp(self):
@@ -458,6 +628,22 @@ class TrainerHyperParameterOptunaIntegrationTest(TestCase):
         )
         self.num_iterations = 1
 
+    @staticmethod
+    def hp_space(trial):
+        return {"learning_rate": trial.suggest_float("learning_rate", 1e-6, 1e-4, log=True)}
+
+    def _create_trainer(self) -> SetFitTrainer:
+        def model_init(params):
+            return SetFitModel.from_pretrained("sentence-transformers/paraphrase-albert-small-v2")
+
+        return SetFitTrainer(
+            train_dataset=self.dataset,
+            eval_dataset=self.dataset,
+            num_iterations=self.num_iterations,
+            model_init=model_init,
+            column_mapping={"text_new": "text", "label_new": "label"},
+        )
+
     def test_hyperparameter_search(self):
         class MyTrialShortNamer(TrialShortNamer):
             DEFAULTS = {"max_iter": 100, "solver": "liblinear"}
@@ -496,6 +682,126 @@ class TrainerHyperParameterOptunaIntegrationTest(TestCase):
         assert isinstance(result, BestRun)
         assert result.hyperparameters.keys() == {"learning_rate", "batch_size", "max_iter", "solver"}
 
+    def test_hyperparameter_search_shared_storage(self):
+        trainer = self._create_trainer()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            storage = f"sqlite:///{pathlib.Path(tmp_dir) / 'study.db'}"
+            for _ in range(2):
+                result = trainer.hyperparameter_search(
+                    hp_space=self.hp_space, n_trials=1, storage=storage, study_name="setfit", load_if_exists=True
+                )
+            assert len(result.backend.trials) == 2
+
+    def test_hyperparameter_search_pruning(self):
+        import optuna
+
+        class PruneSecondTrial(optuna.pruners.BasePruner):
+            def prune(self, study, trial):
+                return trial.number == 1
+
+        trainer = self._create_trainer()
+        result = trainer.hyperparameter_search(hp_space=self.hp_space, n_trials=2, pruner=PruneSecondTrial())
+        states = [trial.state for trial in result.backend.trials]
+        assert states == [optuna.trial.TrialState.COMPLETE, optuna.trial.TrialState.PRUNED]
+        assert len(result.backend.trials[0].intermediate_values) > 0
+
+    def test_hyperparameter_search_concurrent_trials(self):
+        import optuna
+
+        trainer = self._create_trainer()
+        result = trainer.hyperparameter_search(hp_space=self.hp_space, n_trials=4, n_jobs=2)
+        assert all(trial.state == optuna.trial.TrialState.COMPLETE for trial in result.backend.trials)
+        # Every trial has trained and evaluated on its own copy of the trainer
+        assert trainer._metric_cache == {}
+        assert trainer.sentence_transformer_history == trainer._create_history()
+        assert trainer.classifier_history == trainer._create_history()
+
+    def test_hyperparameter_search_without_pruner(self):
+        import optuna
+
+        trainer = self._create_trainer()
+        result = trainer.hyperparameter_search(hp_space=self.hp_space, n_trials=2)
+        assert isinstance(result.backend.pruner, optuna.pruners.NopPruner)
+        assert all(trial.state == optuna.trial.TrialState.COMPLETE for trial in result.backend.trials)
+        # Without a pruner, no validation losses are computed during training
+        assert all(not trial.intermediate_values for trial in result.backend.trials)
+
+
+class _TrialCountingTrainer:
+    """Stands in for a `SetFitTrainer` in the distributed search test, as only the trials are of interest there."""
+
+    def __init__(self, trial_duration: float = 0.0):
+        self.trial_duration = trial_duration
+        self.trained_params = []
+
+    def train(self, trial):
+        self.objective = trial.suggest_float("x", 0.0, 1.0)
+        time.sleep(self.trial_duration)
+        self.trained_params.append(trial.params)
+
+
+def _run_distributed_hp_search(rank: int, world_size: int, tmp_dir: str) -> None:
+    # The trials of the main process outlast the process group timeout, which the other process must not wait in
+    torch.distributed.init_process_group(
+        "gloo",
+        init_method=f"file://{tmp_dir}/init",
+        rank=rank,
+        world_size=world_size,
+        timeout=datetime.timedelta(seconds=2),
+    )
+    trainer = _TrialCountingTrainer(trial_duration=1.5 if rank == 0 else 0.0)
+    storage = f"sqlite:///{pathlib.Path(tmp_dir) / 'study.db'}"
+    with mock.patch("setfit.integrations.SYNC_POLL_INTERVAL", 0.1):
+        best_run = run_hp_search_optuna(trainer, n_trials=4, direction="maximize", storage=storage)
+    torch.distributed.destroy_process_group()
+    with open(pathlib.Path(tmp_dir) / f"rank_{rank}.json", "w") as f:
+        json.dump({"best_run": best_run[:3], "num_trained": len(trainer.trained_params)}, f)
+
+
+@require_optuna
+def test_hyperparameter_search_distributed() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        torch.multiprocessing.spawn(_run_distributed_hp_search, args=(2, tmp_dir), nprocs=2)
+        results = [json.loads((pathlib.Path(tmp_dir) / f"rank_{rank}.json").read_text()) for rank in range(2)]
+
+    # Every process returns the same best run, picked from the trials of all processes
+    assert results[0]["best_run"] == results[1]["best_run"]
+    # The trials are spread over the processes
+    assert [result["num_trained"] for result in results] == [2, 2]
+
+
+@require_optuna
+def test_hyperparameter_search_distributed_requires_storage() -> None:
+    with mock.patch("setfit.integrations._is_distributed", return_value=True):
+        with pytest.raises(ValueError, match="storage"):
+            run_hp_search_optuna(_TrialCountingTrainer(), n_trials=4, direction="maximize")
+
+
+def test_validation_loss_evaluator_collates_once() -> None:
+    class SumLoss(torch.nn.Module):
+        def forward(self, features, labels):
+            # Like the Sentence Transformer modules, write the embeddings into the features
+            features[0].update({"sentence_embedding": features[0]["input_ids"] * 2.0})
+            return (features[0]["sentence_embedding"].sum(dim=1) - labels).abs().mean()
+
+    def collate(examples):
+        input_ids = torch.tensor([example["input_ids"] for example in examples], dtype=torch.float)
+        labels = torch.tensor([example["label"] for example in examples], dtype=torch.float)
+        return [{"input_ids": input_ids}], labels
+
+    examples = [{"input_ids": [i, i + 1], "label": float(i % 2)} for i in range(4)]
+    model = mock.Mock(smart_batching_collate=mock.Mock(side_effect=collate))
+    evaluator = ValidationLossEvaluator(DataLoader(examples, batch_size=2), SumLoss())
+
+    first_loss = evaluator(model)
+    second_loss = evaluator(model)
+
+    assert first_loss == second_loss
+    # Both batches are only collated on the first call
+    assert model.smart_batching_collate.call_count == 2
+    # The cached batches are not modified by the loss
+    assert all(features[0].keys() == {"input_ids"} for features, _ in evaluator._batches)
+
 
 # regression test for https://github.com/huggingface/setfit/issues/153
 @pytest.mark.parametrize(
@@ -582,3 +888,105 @@ def test_trainer_evaluate_on_cpu() -> None:
     )
     trainer.train()
     trainer.evaluate()
+
+
+@pytest.fixture(scope="module")
+def hub_trainer() -> SetFitTrainer:
+    model = SetFitModel.from_pretrained("sentence-transformers/paraphrase-albert-small-v2")
+    return SetFitTrainer(model=model, train_dataset=Dataset.from_dict({"text": ["a"], "label": [0]}))
+
+
+@pytest.fixture
+def hub_api():
+    """Replaces the `HfApi` calls made by `push_to_hub`, by default for an empty repository."""
+    with mock.patch.object(HfApi, "create_repo") as create_repo:
+        with mock.patch.object(HfApi, "repo_info", return_value=mock.Mock(siblings=[], sha="0")) as repo_info:
+            with mock.patch.object(HfApi, "create_commit") as create_commit:
+                create_commit.return_value.commit_url = "https://huggingface.co/org/setfit-model/commit/0"
+                yield mock.Mock(create_repo=create_repo, repo_info=repo_info, create_commit=create_commit)
+
+
+def test_trainer_push_to_hub_single_commit(hub_trainer: SetFitTrainer, hub_api: mock.Mock) -> None:
+    commit_url = hub_trainer.push_to_hub("org/setfit-model", ignore_patterns="*.md", commit_description="Retrained")
+
+    assert commit_url == "https://huggingface.co/org/setfit-model/commit/0"
+    hub_api.create_commit.assert_called_once()
+    assert hub_api.create_commit.call_args.kwargs["commit_description"] == "Retrained"
+    paths_in_repo = {operation.path_in_repo for operation in hub_api.create_commit.call_args.kwargs["operations"]}
+    assert "model_head.pkl" in paths_in_repo
+    assert "README.md" not in paths_in_repo
+
+
+def test_trainer_push_to_hub_unexpected_kwargs(hub_trainer: SetFitTrainer, hub_api: mock.Mock) -> None:
+    with pytest.raises(TypeError, match="create_commit"):
+        hub_trainer.push_to_hub("org/setfit-model", safe_serialization=True)
+    hub_api.create_repo.assert_not_called()
+
+
+def test_trainer_push_to_hub_without_waiting(hub_trainer: SetFitTrainer, hub_api: mock.Mock) -> None:
+    future = hub_trainer.push_to_hub("org/setfit-model", wait=False)
+    assert future.result() == "https://huggingface.co/org/setfit-model/commit/0"
+
+    # The temporary model directory is removed once the upload has finished
+    operations = hub_api.create_commit.call_args.kwargs["operations"]
+    assert not any(pathlib.Path(operation.path_or_fileobj).exists() for operation in operations)
+
+
+@pytest.mark.parametrize("repo_id", ["setfit-model", "org/setfit model", "org/setfit/model"])
+def test_trainer_push_to_hub_invalid_repo_id(hub_trainer: SetFitTrainer, hub_api: mock.Mock, repo_id: str) -> None:
+    with pytest.raises(ValueError):
+        hub_trainer.push_to_hub(repo_id)
+    hub_api.create_repo.assert_not_called()
+
+
+def test_trainer_push_to_hub_skips_unchanged_files(hub_trainer: SetFitTrainer, hub_api: mock.Mock) -> None:
+    model = hub_trainer.model
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model.save_pretrained(tmp_dir)
+        # Only the head is retrained
+        model.model_head.fit(model.model_body.encode(["positive", "negative"]), [1, 0])
+        hub_api.repo_info.return_value.siblings = [
+            mock.Mock(rfilename=path.relative_to(tmp_dir).as_posix(), lfs=None, blob_id=_file_digests(path)[0])
+            for path in pathlib.Path(tmp_dir).glob("**/*")
+            if path.is_file()
+        ]
+
+    hub_trainer.push_to_hub("org/setfit-model")
+
+    paths_in_repo = {operation.path_in_repo for operation in hub_api.create_commit.call_args.kwargs["operations"]}
+    assert "model_head.pkl" in paths_in_repo
+    assert "config.json" not in paths_in_repo
+    # The commit is based on the revision the files were compared against
+    assert hub_api.create_commit.call_args.kwargs["parent_commit"] == "0"
+
+    hub_trainer.push_to_hub("org/setfit-model", parent_commit="1")
+    assert hub_api.create_commit.call_args.kwargs["parent_commit"] == "1"
+
+
+def test_trainer_push_to_hub_retries_rate_limits(hub_trainer: SetFitTrainer, hub_api: mock.Mock) -> None:
+    rate_limited = HfHubHTTPError(
+        "Too Many Requests", response=mock.Mock(status_code=429, headers={"Retry-After": "3"})
+    )
+    hub_api.create_commit.side_effect = [rate_limited, hub_api.create_commit.return_value]
+    with mock.patch("time.sleep") as sleep:
+        commit_url = hub_trainer.push_to_hub("org/setfit-model")
+
+    assert commit_url == "https://huggingface.co/org/setfit-model/commit/0"
+    assert hub_api.create_commit.call_count == 2
+    sleep.assert_called_once_with(3.0)
+
+
+def test_trainer_push_to_hub_retries_every_request(hub_trainer: SetFitTrainer, hub_api: mock.Mock) -> None:
+    unavailable = HfHubHTTPError(
+        "Service Unavailable", response=mock.Mock(status_code=503, headers={"Retry-After": "3600"})
+    )
+    hub_api.create_repo.side_effect = [unavailable, None]
+    hub_api.repo_info.side_effect = [unavailable, hub_api.repo_info.return_value]
+    with mock.patch("time.sleep") as sleep:
+        commit_url = hub_trainer.push_to_hub("org/setfit-model")
+
+    assert commit_url == "https://huggingface.co/org/setfit-model/commit/0"
+    assert hub_api.create_repo.call_count == 2
+    assert hub_api.repo_info.call_count == 2
+    # The delay requested by the Hub is capped
+    assert sleep.call_args_list == [mock.call(60.0), mock.call(60.0)]